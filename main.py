@@ -1,29 +1,222 @@
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import gspread
 from google.oauth2 import service_account
+import functools
 import json
+import logging
 import os
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+try:
+    # orjson parses JSON bytes several times faster than the standard library
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 CONFIG_FILE = 'config.json'  # Path to your configuration file
+MAX_CONCURRENT_REQUESTS = 12  # Upper bound on in-flight Sleeper API requests
+SEASON_WEEKS = range(1, 19)  # Assuming 18 weeks in the season
+WEEK_LABELS = tuple(f"Week {week}" for week in SEASON_WEEKS)  # Column label for each week, indexed by week - 1
+WEEK_COL_SET = frozenset(WEEK_LABELS)
+REQUEST_TIMEOUT = 10  # Seconds to wait on a Sleeper API response
+DEFAULT_CACHE_FILE = 'sleeper_cache.sqlite'  # On-disk cache of Sleeper API responses
+HISTORICAL_CACHE_TTL = timedelta(days=30)  # Leagues Sleeper reports as complete no longer change
+CURRENT_SEASON_CACHE_TTL = timedelta(minutes=10)  # The current season is still being played
+PLAYERS_CACHE_TTL = timedelta(days=1)  # The NFL player list is large and changes at most daily
+
+logger = logging.getLogger(__name__)
 
 # Load the configuration from config.json
 with open(CONFIG_FILE, 'r') as config_file:
     config = json.load(config_file)
 
+def create_http_session(cache_file=DEFAULT_CACHE_FILE):
+    """
+    Creates a cached requests session that reuses connections to the Sleeper API,
+    asks for gzip-compressed responses, and retries transient failures.
+
+    Args:
+        cache_file (str): Path to the SQLite file used to cache API responses.
+
+    Returns:
+        requests_cache.CachedSession: The configured session.
+    """
+    session = requests_cache.CachedSession(cache_file, backend='sqlite', expire_after=CURRENT_SEASON_CACHE_TTL)
+    # raise_on_status=False hands the final failed response back so callers can report its status code
+    retries = Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retries)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    return session
+
+@functools.lru_cache(maxsize=4)
+def load_player_names(path, mtime):
+    """
+    Parses a players JSON file into a player ID to name mapping.
+
+    The result is memoized on (path, mtime), so the file is only parsed again when it changes on disk.
+
+    Args:
+        path (str): Path to the players JSON file.
+        mtime (float): Modification time of the file, used as part of the cache key.
+
+    Returns:
+        dict: A dictionary where keys are player IDs and values are player names.
+    """
+    with open(path, 'rb') as file:
+        players_data = json_loads(file.read())
+    return {pid: pdata.get('full_name', 'Unknown Player') for pid, pdata in players_data.items()}
+
+def cache_ttl(year):
+    """
+    Returns how long API responses for a given league year may be served from the cache.
+    Used when the league's own status is unavailable.
+
+    Args:
+        year (str): The year of the league, or None when unknown.
+
+    Returns:
+        timedelta: The cache expiration for that year's responses.
+    """
+    now = datetime.now()
+    if year is None or str(year) == str(now.year):
+        return CURRENT_SEASON_CACHE_TTL
+    # The NFL season runs into January and February, so last year's season may still be in progress
+    if now.month <= 2 and str(year) == str(now.year - 1):
+        return CURRENT_SEASON_CACHE_TTL
+    return HISTORICAL_CACHE_TTL
+
+class SleeperClient:
+    """
+    This class handles all requests to the Sleeper API. A single instance is shared by the
+    processors, so each league's users and rosters are fetched at most once per run.
+    """
+
+    # Sleeper API endpoints, as bound str.format methods so building a URL is a single call
+    LEAGUE_URL = 'https://api.sleeper.app/v1/league/{}'.format
+    LEAGUE_RESOURCE_URL = 'https://api.sleeper.app/v1/league/{}/{}'.format
+    MATCHUPS_URL = 'https://api.sleeper.app/v1/league/{}/matchups/{}'.format
+    PLAYERS_URL = 'https://api.sleeper.app/v1/players/nfl'
+
+    def __init__(self, cache_file=DEFAULT_CACHE_FILE):
+        """
+        Initializes the client with a cached, pooled HTTP session.
+
+        Args:
+            cache_file (str): Path to the SQLite file used to cache API responses.
+        """
+        self.session = create_http_session(cache_file)
+        self._league_data = {}  # (league_id, resource) -> successfully fetched JSON
+        self._league_ttls = {}  # league_id -> cache expiration derived from the league's status
+        self._league_locks = {}  # league_id -> lock, so concurrent callers wait for one fetch of that league's status
+        self._league_locks_lock = threading.Lock()
+        self._players = None
+        self._players_lock = threading.Lock()  # Concurrent callers wait for one download of the player list
+
+    def fetch_json(self, url, year=None, expire_after=None):
+        """
+        Fetches a Sleeper API URL and returns the decoded JSON response.
+
+        Args:
+            url (str): The URL to fetch.
+            year (str, optional): The league year, used to pick the cache expiration.
+            expire_after (timedelta, optional): Overrides the cache expiration derived from the year.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or returns an error status.
+        """
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT, expire_after=expire_after or cache_ttl(year))
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def league_cache_ttl(self, league_id, year=None):
+        """
+        Returns how long a league's responses may be served from the cache. Only leagues that
+        Sleeper reports as complete get the long historical expiration; if the league itself
+        cannot be fetched, the expiration falls back to one derived from the year.
+        """
+        if league_id in self._league_ttls:
+            return self._league_ttls[league_id]
+
+        with self._league_locks_lock:
+            league_lock = self._league_locks.setdefault(league_id, threading.Lock())
+
+        with league_lock:
+            if league_id not in self._league_ttls:
+                try:
+                    league = self.fetch_json(self.LEAGUE_URL(league_id), expire_after=CURRENT_SEASON_CACHE_TTL)
+                except requests.exceptions.RequestException as e:
+                    logger.warning("Unable to fetch the status of league %s (%s)", league_id, e)
+                    league = None
+                if isinstance(league, dict):
+                    complete = league.get('status') == 'complete'
+                    ttl = HISTORICAL_CACHE_TTL if complete else CURRENT_SEASON_CACHE_TTL
+                else:
+                    # The status is unavailable; the fallback is stored too, so the league is only tried once per run
+                    ttl = cache_ttl(year)
+                self._league_ttls[league_id] = ttl
+            return self._league_ttls[league_id]
+
+    def _league_resource(self, league_id, resource, year):
+        """
+        Fetches a league-level resource once and serves repeat calls from memory.
+        Failed requests raise and are not cached, so a later call retries them.
+        """
+        key = (league_id, resource)
+        if key not in self._league_data:
+            self._league_data[key] = self.fetch_json(
+                self.LEAGUE_RESOURCE_URL(league_id, resource), expire_after=self.league_cache_ttl(league_id, year))
+        return self._league_data[key]
+
+    def users(self, league_id, year=None):
+        """
+        Returns the list of users in a league.
+        """
+        return self._league_resource(league_id, 'users', year)
+
+    def rosters(self, league_id, year=None):
+        """
+        Returns the list of rosters in a league.
+        """
+        return self._league_resource(league_id, 'rosters', year)
+
+    def matchups(self, league_id, week, year=None):
+        """
+        Returns the list of matchups for a week of a league.
+        """
+        return self.fetch_json(self.MATCHUPS_URL(league_id, week), expire_after=self.league_cache_ttl(league_id, year))
+
+    def players(self):
+        """
+        Returns the full NFL player dictionary, fetched once per client.
+        """
+        with self._players_lock:
+            if self._players is None:
+                self._players = self.fetch_json(self.PLAYERS_URL, expire_after=PLAYERS_CACHE_TTL)
+        return self._players
+
 class SleeperSheets:
     """
     This class handles all operations related to fetching data from the Sleeper API,
     processing that data, and uploading it to Google Sheets.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, client=None):
         """
         Initializes the class using the provided configuration.
 
         Args:
             config (dict): Configuration settings.
+            client (SleeperClient, optional): Sleeper API client to share with other processors.
         """
         self.config = config
         self.spreadsheet_id = self.config['spreadsheet_id']
@@ -31,7 +224,23 @@ class SleeperSheets:
         self.players_file = self.config.get('players_file')
         self.league_ids = self.config['league_ids']
         self.current_year = datetime.now().year  # Get the current calendar year
-        print(f"Initialized SleeperSheets with config: {self.config}")
+        self.client = client or SleeperClient(self.config.get('cache_file', DEFAULT_CACHE_FILE))
+        self.gc = self.authorize_google_sheets()
+        self.spreadsheet = self.gc.open_by_key(self.spreadsheet_id)
+        logger.debug("Initialized SleeperSheets with config: %s", self.config)
+
+    def authorize_google_sheets(self):
+        """
+        Authorizes and returns a gspread client for Google Sheets.
+
+        Returns:
+            gspread.Client: The authorized client, reused for every upload.
+        """
+        credentials = service_account.Credentials.from_service_account_file(
+            self.service_account_file,
+            scopes=["https://www.googleapis.com/auth/spreadsheets"]
+        )
+        return gspread.authorize(credentials)
 
     def load_player_data(self):
         """
@@ -40,17 +249,25 @@ class SleeperSheets:
         Returns:
             dict: A dictionary where keys are player IDs and values are player names.
         """
-        print(f"Loading player data from {self.players_file}...")
+        logger.debug("Loading player data from %s...", self.players_file)
         if self.players_file and os.path.exists(self.players_file):
-            with open(self.players_file, 'r') as file:
-                players_data = json.load(file)
-            player_names = {pid: pdata.get('full_name', 'Unknown Player') for pid, pdata in players_data.items()}
-            print(f"Player data loaded successfully. Found {len(player_names)} players.")
+            player_names = load_player_names(self.players_file, os.path.getmtime(self.players_file))
+            logger.debug("Player data loaded successfully. Found %s players.", len(player_names))
             return player_names
         else:
-            print(f"Error: Player data file {self.players_file} not found.")
+            logger.error("Player data file %s not found.", self.players_file)
             return {}
 
+    @functools.cached_property
+    def player_names(self):
+        """
+        Player ID to name mapping, loaded from the players file on first access.
+
+        Returns:
+            dict: A dictionary where keys are player IDs and values are player names.
+        """
+        return self.load_player_data()
+
     def fetch_users(self, league_id, year):
         """
         Fetches user data for a specific league.
@@ -62,16 +279,14 @@ class SleeperSheets:
         Returns:
             list: A list of user data dictionaries.
         """
-        print(f"Fetching user data for league ID {league_id} (Year: {year})...")
-        url = f'https://api.sleeper.app/v1/league/{league_id}/users'
-        response = requests.get(url)
-        if response.status_code == 200:
-            users = response.json()
-            print(f"Fetched {len(users)} users.")
-            return users
-        else:
-            print(f"Error: Unable to fetch user data for league year {year} (Status code: {response.status_code})")
+        logger.debug("Fetching user data for league ID %s (Year: %s)...", league_id, year)
+        try:
+            users = self.client.users(league_id, year)
+        except requests.exceptions.RequestException as e:
+            logger.error("Unable to fetch user data for league year %s (%s)", year, e)
             return []
+        logger.debug("Fetched %s users.", len(users))
+        return users
 
     def fetch_matchups(self, league_id, week, year):
         """
@@ -83,18 +298,16 @@ class SleeperSheets:
             year (str): The year of the league for error reporting.
 
         Returns:
-            list: A list of matchup data dictionaries.
-        """
-        print(f"Fetching matchup data for league ID {league_id}, week {week} (Year: {year})...")
-        url = f'https://api.sleeper.app/v1/league/{league_id}/matchups/{week}'
-        response = requests.get(url)
-        if response.status_code == 200:
-            matchups = response.json()
-            print(f"Fetched {len(matchups)} matchups for week {week}.")
-            return matchups
-        else:
-            print(f"Error: Unable to fetch matchup data for league year {year}, week {week} (Status code: {response.status_code})")
-            return []
+            list: A list of matchup data dictionaries, or None if the request failed.
+        """
+        logger.debug("Fetching matchup data for league ID %s, week %s (Year: %s)...", league_id, week, year)
+        try:
+            matchups = self.client.matchups(league_id, week, year)
+        except requests.exceptions.RequestException as e:
+            logger.error("Unable to fetch matchup data for league year %s, week %s (%s)", year, week, e)
+            return None
+        logger.debug("Fetched %s matchups for week %s.", len(matchups), week)
+        return matchups
 
     def fetch_rosters(self, league_id, year):
         """
@@ -107,16 +320,75 @@ class SleeperSheets:
         Returns:
             list: A list of roster data dictionaries.
         """
-        print(f"Fetching roster data for league ID {league_id} (Year: {year})...")
-        url = f'https://api.sleeper.app/v1/league/{league_id}/rosters'
-        response = requests.get(url)
-        if response.status_code == 200:
-            rosters = response.json()
-            print(f"Fetched {len(rosters)} rosters.")
-            return rosters
-        else:
-            print(f"Error: Unable to fetch roster data for league year {year} (Status code: {response.status_code})")
+        logger.debug("Fetching roster data for league ID %s (Year: %s)...", league_id, year)
+        try:
+            rosters = self.client.rosters(league_id, year)
+        except requests.exceptions.RequestException as e:
+            logger.error("Unable to fetch roster data for league year %s (%s)", year, e)
             return []
+        logger.debug("Fetched %s rosters.", len(rosters))
+        return rosters
+
+    def submit_season_fetches(self, executor, league_id, year):
+        """
+        Queues the users, rosters, and weekly matchup requests for a league on an executor.
+
+        Args:
+            executor (ThreadPoolExecutor): The executor to dispatch requests on.
+            league_id (str): The ID of the league to fetch data for.
+            year (str): The year of the league for error reporting.
+
+        Returns:
+            Tuple[Future, Future, dict]: Futures for users and rosters, and a dict mapping week number to a matchups future.
+        """
+        users_future = executor.submit(self.fetch_users, league_id, year)
+        rosters_future = executor.submit(self.fetch_rosters, league_id, year)
+        matchup_futures = {week: executor.submit(self.fetch_matchups, league_id, week, year) for week in SEASON_WEEKS}
+        return users_future, rosters_future, matchup_futures
+
+    def collect_season_fetches(self, season_futures):
+        """
+        Waits for the futures returned by submit_season_fetches and unpacks their results.
+
+        Args:
+            season_futures (tuple): The futures returned by submit_season_fetches.
+
+        Returns:
+            Tuple[list, list, dict]: Users, rosters, and a dict mapping week number to matchups.
+        """
+        users_future, rosters_future, matchup_futures = season_futures
+        week_matchups = {week: future.result() for week, future in matchup_futures.items()}
+        return users_future.result(), rosters_future.result(), week_matchups
+
+    def fetch_season_data(self, league_id, year):
+        """
+        Fetches users, rosters, and every week's matchups for a league concurrently.
+
+        Args:
+            league_id (str): The ID of the league to fetch data for.
+            year (str): The year of the league for error reporting.
+
+        Returns:
+            Tuple[list, list, dict]: Users, rosters, and a dict mapping week number to matchups.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return self.collect_season_fetches(self.submit_season_fetches(executor, league_id, year))
+
+    def fetch_all_seasons(self):
+        """
+        Fetches the data for every configured league through a single bounded pool,
+        so requests from different seasons overlap instead of running league by league.
+
+        Returns:
+            dict: A dictionary mapping each year with a league ID to its (users, rosters, week_matchups) tuple.
+        """
+        logger.info("Fetching data for all configured leagues...")
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            pending = {
+                year: self.submit_season_fetches(executor, league_id, year)
+                for year, league_id in self.league_ids.items() if league_id
+            }
+            return {year: self.collect_season_fetches(season_futures) for year, season_futures in pending.items()}
 
     def filter_rows(self, df):
         """
@@ -128,124 +400,122 @@ class SleeperSheets:
         Returns:
             pd.DataFrame: The filtered DataFrame.
         """
-        print("Filtering rows with more than 5 weeks of zero points...")
-        week_columns = [col for col in df.columns if col.startswith('Week')]
-        filtered_df = df[df[week_columns].eq(0).sum(axis=1) <= 5]
-        print(f"Filtered DataFrame has {len(filtered_df)} rows.")
+        logger.debug("Filtering rows with more than 5 weeks of zero points...")
+        week_columns = [col for col in df.columns if col in WEEK_COL_SET]
+        week_points = df.loc[:, week_columns].to_numpy(dtype=np.float64, copy=False)
+        filtered_df = df.iloc[np.count_nonzero(week_points == 0, axis=1) <= 5]
+        logger.debug("Filtered DataFrame has %s rows.", len(filtered_df))
         return filtered_df
 
-    def process_season(self, league_id, year):
+    def process_season(self, league_id, year, season_data=None):
         """
         Processes the season data for a specific league and year.
 
         Args:
             league_id (str): The ID of the league.
             year (str): The year of the league.
+            season_data (tuple, optional): Prefetched (users, rosters, week_matchups) for the league.
+                Fetched from the API when not provided.
 
         Returns:
             Tuple[pd.DataFrame, pd.DataFrame]: A tuple containing:
                 - A DataFrame with weekly points, total points, and wins for each user.
                 - A DataFrame with wins and losses for each user.
         """
-        print(f"Processing season data for league ID {league_id} (Year: {year})...")
-        users = self.fetch_users(league_id, year)
-        rosters = self.fetch_rosters(league_id, year)
+        logger.debug("Processing season data for league ID %s (Year: %s)...", league_id, year)
+        if season_data is None:
+            season_data = self.fetch_season_data(league_id, year)
+        users, rosters, week_matchups = season_data
 
         if not users or not rosters:
-            print(f"No data available for league year {year}.")
+            logger.warning("No data available for league year %s.", year)
             return pd.DataFrame(), pd.DataFrame()
 
         roster_to_user = {roster['roster_id']: roster.get('owner_id', None) for roster in rosters}
         user_ids = {user['user_id']: user.get('display_name', 'Unknown') for user in users}
-        user_data = {user_id: {'display_name': display_name} for user_id, display_name in user_ids.items()}
+        user_index = {user_id: i for i, user_id in enumerate(user_ids)}
+        # Resolve each roster straight to its owner's row so the week loop needs a single lookup
+        roster_to_row = {roster_id: user_index[user_id] for roster_id, user_id in roster_to_user.items() if user_id in user_index}
 
-        # Initialize wins and losses counters
-        user_wins = {user_id: 0 for user_id in user_data}
-        user_losses = {user_id: 0 for user_id in user_data}
+        # Initialize wins and losses counters, indexed by user row
+        user_wins = np.zeros(len(user_index), dtype=np.int16)
+        user_losses = np.zeros(len(user_index), dtype=np.int16)
 
-        weeks = range(1, 19)  # Assuming 18 weeks in the season
+        weeks = SEASON_WEEKS
+        # One row per user, one column per week
+        weekly_points = np.zeros((len(user_index), len(weeks)), dtype=np.float64)
 
         for week in weeks:
-            print(f"Processing week {week}...")
-            matchups = self.fetch_matchups(league_id, week, year)
-            if matchups:
-                # Organize matchups by matchup_id
-                matchup_dict = {}
-                for matchup in matchups:
-                    matchup_id = matchup['matchup_id']
-                    if matchup_id not in matchup_dict:
-                        matchup_dict[matchup_id] = []
-                    matchup_dict[matchup_id].append(matchup)
+            logger.debug("Processing week %s...", week)
+            matchups = week_matchups[week]
+            if matchups is None:
+                # The fetch failed; skip just this week rather than ending the season here
+                continue
+            if not matchups or all(matchup.get('points', 0) == 0 for matchup in matchups):
+                # An empty or scoreless week has not been played yet, and neither have the weeks after it
+                logger.debug("Week %s of %s has no points. Skipping the remaining weeks.", week, year)
+                break
 
-                # Determine winners and update wins and losses
-                for matchup_id, teams in matchup_dict.items():
-                    if len(teams) != 2:
-                        # In case of bye weeks or incomplete data
-                        continue
-                    team1, team2 = teams
-                    points1 = team1.get('points', 0)
-                    points2 = team2.get('points', 0)
-                    roster_id1 = team1['roster_id']
-                    roster_id2 = team2['roster_id']
-                    user_id1 = roster_to_user.get(roster_id1)
-                    user_id2 = roster_to_user.get(roster_id2)
-                    if points1 > points2:
-                        # user1 wins, user2 loses
-                        if user_id1 in user_wins:
-                            user_wins[user_id1] += 1
-                        if user_id2 in user_losses:
-                            user_losses[user_id2] += 1
-                    elif points2 > points1:
-                        # user2 wins, user1 loses
-                        if user_id2 in user_wins:
-                            user_wins[user_id2] += 1
-                        if user_id1 in user_losses:
-                            user_losses[user_id1] += 1
-                    else:
-                        # Handle ties if necessary
-                        pass
+            # Organize matchups by matchup_id
+            matchup_dict = {}
+            for matchup in matchups:
+                matchup_id = matchup['matchup_id']
+                if matchup_id not in matchup_dict:
+                    matchup_dict[matchup_id] = []
+                matchup_dict[matchup_id].append(matchup)
 
-                # Collect weekly points
-                for matchup in matchups:
-                    roster_id = matchup['roster_id']
-                    points = matchup['points']
-                    user_id = roster_to_user.get(roster_id)
-                    if user_id and user_id in user_data:
-                        user_data[user_id][f"Week {week}"] = points
-
-        # Build DataFrame rows for weekly points
-        rows = []
-        for user_id, data in user_data.items():
-            row = [user_id, data.get('display_name', 'N/A')]
-            total_points = 0
-            for week in weeks:
-                week_points = data.get(f"Week {week}", 0)
-                row.append(week_points)
-                total_points += week_points
-            row.append(total_points)
-            wins = user_wins.get(user_id, 0)
-            row.append(wins)
-            rows.append(row)
-
-        # Define DataFrame columns including the 'Wins' column
-        df_columns = ['User ID', 'Display Name'] + [f"Week {week}" for week in weeks] + ['Season Total', 'Wins']
-
-        df = pd.DataFrame(rows, columns=df_columns)
+            # Determine winners and update wins and losses
+            for matchup_id, teams in matchup_dict.items():
+                if len(teams) != 2:
+                    # In case of bye weeks or incomplete data
+                    continue
+                team1, team2 = teams
+                points1 = team1.get('points', 0)
+                points2 = team2.get('points', 0)
+                row1 = roster_to_row.get(team1['roster_id'])
+                row2 = roster_to_row.get(team2['roster_id'])
+                if points1 > points2:
+                    # user1 wins, user2 loses
+                    if row1 is not None:
+                        user_wins[row1] += 1
+                    if row2 is not None:
+                        user_losses[row2] += 1
+                elif points2 > points1:
+                    # user2 wins, user1 loses
+                    if row2 is not None:
+                        user_wins[row2] += 1
+                    if row1 is not None:
+                        user_losses[row1] += 1
+                else:
+                    # Handle ties if necessary
+                    pass
 
-        # Build DataFrame for wins and losses
-        win_loss_rows = []
-        for user_id in user_data:
-            display_name = user_data[user_id]['display_name']
-            wins = user_wins.get(user_id, 0)
-            losses = user_losses.get(user_id, 0)
-            win_loss_rows.append([year, display_name, wins, losses])
+            # Collect weekly points
+            for matchup in matchups:
+                row = roster_to_row.get(matchup['roster_id'])
+                if row is not None:
+                    weekly_points[row, week - 1] = matchup['points']
+
+        # Wrap the points matrix as a single float block so week columns stay contiguous, then add the other columns
+        week_columns = list(WEEK_LABELS)
+        df = pd.DataFrame(weekly_points, columns=week_columns, copy=False)
+        df.insert(0, 'User ID', np.array(list(user_ids.keys()), dtype=object))
+        df.insert(1, 'Display Name', np.array(list(user_ids.values()), dtype=object))
+        df['Season Total'] = weekly_points.sum(axis=1)
+        df['Wins'] = user_wins
 
-        win_loss_df = pd.DataFrame(win_loss_rows, columns=['Season', 'Display Name', 'Wins', 'Losses'])
+        # Build DataFrame for wins and losses
+        win_loss_df = pd.DataFrame({
+            'Season': np.full(len(user_index), year, dtype=object),
+            'Display Name': df['Display Name'].to_numpy(),
+            'Wins': user_wins,
+            'Losses': user_losses,
+        }, copy=False)
 
         if year != str(self.current_year):
             df = self.filter_rows(df)
 
-        print(f"Processed data for league year {year}. DataFrame shape: {df.shape}.")
+        logger.debug("Processed data for league year %s. DataFrame shape: %s.", year, df.shape)
         return df, win_loss_df
 
     def create_win_loss_summary(self, combined_win_loss_df):
@@ -313,84 +583,167 @@ class SleeperSheets:
             sheet_name (str): The name of the sheet to upload data to.
             df (pd.DataFrame): The DataFrame to upload.
         """
-        credentials = service_account.Credentials.from_service_account_file(
-            self.service_account_file,
-            scopes=["https://www.googleapis.com/auth/spreadsheets"]
-        )
-        client = gspread.authorize(credentials)
-        spreadsheet = client.open_by_key(self.spreadsheet_id)
+        self.upload_sheets({sheet_name: df})
 
-        try:
-            sheet = spreadsheet.worksheet(sheet_name)
-            sheet.clear()  # Clear existing data
-        except gspread.exceptions.WorksheetNotFound:
-            sheet = spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="20")  # Create new sheet if not found
+    def upload_sheets(self, sheet_dfs):
+        """
+        Uploads several DataFrames to their sheets in Google Sheets, clearing and writing
+        every sheet with one batched request each instead of separate calls per sheet.
+
+        Args:
+            sheet_dfs (dict): A dictionary mapping sheet names to the DataFrames to upload.
+        """
+        if not sheet_dfs:
+            return
+
+        existing_sheets = {sheet.title for sheet in self.spreadsheet.worksheets()}
+        for sheet_name in sheet_dfs:
+            if sheet_name not in existing_sheets:
+                self.spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="20")  # Create new sheet if not found
+
+        # Sheet names are quoted in A1 notation, with embedded quotes doubled
+        quoted_names = {sheet_name: "'" + sheet_name.replace("'", "''") + "'" for sheet_name in sheet_dfs}
 
-        # Update sheet with DataFrame data
-        data = [df.columns.values.tolist()] + df.values.tolist()
-        sheet.update('A1', data)
+        # Clear existing data on every sheet in one request
+        self.spreadsheet.values_batch_clear(body={'ranges': list(quoted_names.values())})
+
+        # Write every sheet's DataFrame data in one request; RAW skips Sheets' formula parsing
+        self.spreadsheet.values_batch_update(body={
+            'valueInputOption': 'RAW',
+            'data': [
+                {'range': f"{quoted_names[sheet_name]}!A1", 'values': [df.columns.values.tolist()] + df.values.tolist()}
+                for sheet_name, df in sheet_dfs.items()
+            ],
+        })
 
     def run(self):
         """
         Main method to run the data processing and uploading tasks.
         """
-        print("Starting SleeperSheets execution...")
+        logger.info("Starting SleeperSheets execution...")
 
         # Process each season
         season_dfs = {}
         win_loss_data = []  # List to collect win/loss data across seasons
+        sheet_uploads = {}  # Sheets to write, uploaded together once every season is processed
+
+        # Issue every league's API requests up front so they share one bounded pool
+        all_season_data = self.fetch_all_seasons()
 
         for year, league_id in self.league_ids.items():
             if league_id:  # Check if league_id is not empty
-                print(f"Processing {year} season data...")
-                season_df, win_loss_df = self.process_season(league_id, year)
+                logger.info("Processing %s season data...", year)
+                season_df, win_loss_df = self.process_season(league_id, year, all_season_data[year])
                 sheet_name = f"{year} Season - Weekly Points"
                 if not season_df.empty:
-                    print(f"Uploading {year} season data to Google Sheets.")
-                    self.upload_to_google_sheets(sheet_name, season_df)
+                    logger.debug("Queueing %s season data for upload to Google Sheets.", year)
+                    sheet_uploads[sheet_name] = season_df
                     season_dfs[year] = season_df
                 else:
-                    print(f"No data available for {year} season.")
+                    logger.warning("No data available for %s season.", year)
 
                 if not win_loss_df.empty:
                     win_loss_data.append(win_loss_df)
             else:
-                print(f"No League ID provided for Year: {year}")
+                logger.info("No League ID provided for Year: %s", year)
 
         # Combine all win/loss data into a single DataFrame
         if win_loss_data:
             combined_win_loss_df = pd.concat(win_loss_data, ignore_index=True)
             # Process combined win/loss data to match desired format
             win_loss_summary_df = self.create_win_loss_summary(combined_win_loss_df)
-            # Upload win/loss data to Google Sheets
-            self.upload_to_google_sheets("Win / Loss", win_loss_summary_df)
+            sheet_uploads["Win / Loss"] = win_loss_summary_df
 
-        print("SleeperSheets execution completed.")
+        # Upload every sheet to Google Sheets in one batch
+        logger.info("Uploading %s sheet(s) to Google Sheets.", len(sheet_uploads))
+        self.upload_sheets(sheet_uploads)
 
-class MarginCalculator:
+        logger.info("SleeperSheets execution completed.")
+
+class ProcessedWeeksLog:
+    """
+    Base class for processors that record which weeks they have handled in a log file of 'year,week' lines.
+    The log file stays open for the whole run; use the processor as a context manager so it is closed.
+    """
+
+    def open_processed_weeks_log(self, processed_weeks_file):
+        """
+        Loads the processed weeks and opens the log file for appending.
+        Called last in __init__, so the file is not left open if an earlier step raises.
+        """
+        self.processed_weeks_file = processed_weeks_file
+        self.processed_weeks = self.load_processed_weeks()
+        # Kept open for the whole run; entries are flushed once all leagues are done
+        self._log_fh = open(self.processed_weeks_file, 'a', buffering=8192)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Flushes and closes the processed weeks log file.
+        """
+        self._log_fh.close()
+
+    def load_processed_weeks(self):
+        """
+        Loads the processed weeks from a log file in format 'year,week' per line.
+        If the file does not exist, it creates an empty set.
+        """
+        processed_weeks = set()
+        if os.path.exists(self.processed_weeks_file):
+            with open(self.processed_weeks_file, 'r') as file:
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        processed_weeks.add(line)
+        return processed_weeks
+
+    def save_processed_weeks(self, year, weeks):
+        """
+        Appends several processed weeks of a year to the log file in a single write.
+        """
+        if not weeks:
+            return
+        entries = [f"{year},{week}" for week in weeks]
+        self._log_fh.writelines(f"{entry}\n" for entry in entries)
+        self.processed_weeks.update(entries)
+
+    def is_week_processed(self, year, week):
+        """
+        Checks if a particular week of a year has already been processed.
+        """
+        return f"{year},{week}" in self.processed_weeks
+
+class MarginCalculator(ProcessedWeeksLog):
     """
     This class handles fetching matchup data from the Sleeper API,
     calculating the largest and smallest margins of victory,
     and uploading the results to Google Sheets.
     """
 
-    def __init__(self, config, processed_weeks_file='processed_weeks_margin_calculator.log'):
+    def __init__(self, config, processed_weeks_file='processed_weeks_margin_calculator.log', client=None):
         """
         Initializes the class by loading configuration settings from a dictionary.
+        An existing SleeperClient can be passed in to share its cached league data.
         """
         self.config = config
         self.spreadsheet_id = self.config['spreadsheet_id']
         self.service_account_file = self.config['service_account_file']
         self.league_ids = self.config['league_ids']
-        self.processed_weeks_file = processed_weeks_file
+        self.client = client or SleeperClient(self.config.get('cache_file', DEFAULT_CACHE_FILE))
         self.gc = self.authorize_google_sheets()
         self.spreadsheet = self.gc.open_by_key(self.spreadsheet_id)
-        self.processed_weeks = self.load_processed_weeks()
+        self._worksheets = {}  # sheet name -> worksheet, so each sheet is looked up once
         # Flags to determine if sheets exist
         self.largest_margin_sheet_exists = self.sheet_exists("Largest Margin")
         self.smallest_margin_sheet_exists = self.sheet_exists("Smallest Margin")
         # If either sheet does not exist, process all data
         self.process_all_data = not (self.largest_margin_sheet_exists and self.smallest_margin_sheet_exists)
+        self.open_processed_weeks_log(processed_weeks_file)
 
     def authorize_google_sheets(self):
         """
@@ -406,7 +759,7 @@ class MarginCalculator:
         Checks if a sheet exists in the spreadsheet.
         """
         try:
-            self.spreadsheet.worksheet(sheet_name)
+            self._worksheets[sheet_name] = self.spreadsheet.worksheet(sheet_name)
             return True
         except gspread.exceptions.WorksheetNotFound:
             return False
@@ -414,168 +767,162 @@ class MarginCalculator:
     def open_or_create_sheet(self, sheet_name):
         """
         Opens an existing worksheet or creates a new one if it doesn't exist.
+        Worksheets are cached, so repeated calls do not go back to the Sheets API.
         """
-        try:
-            worksheet = self.spreadsheet.worksheet(sheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            worksheet = self.spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="10")
-        return worksheet
-
-    def load_processed_weeks(self):
-        """
-        Loads the processed weeks from a log file in format 'year,week' per line.
-        If the file does not exist, it creates an empty set.
-        """
-        processed_weeks = set()
-        if os.path.exists(self.processed_weeks_file):
-            with open(self.processed_weeks_file, 'r') as file:
-                for line in file:
-                    line = line.strip()
-                    if line:
-                        processed_weeks.add(line)
-        return processed_weeks
-
-    def save_processed_week(self, year, week):
-        """
-        Appends the processed week to the log file.
-        """
-        with open(self.processed_weeks_file, 'a') as file:
-            file.write(f"{year},{week}\n")
-        self.processed_weeks.add(f"{year},{week}")
+        if sheet_name not in self._worksheets:
+            try:
+                self._worksheets[sheet_name] = self.spreadsheet.worksheet(sheet_name)
+            except gspread.exceptions.WorksheetNotFound:
+                self._worksheets[sheet_name] = self.spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="10")
+        return self._worksheets[sheet_name]
 
-    def get_user_mappings(self, league_id):
+    def get_user_mappings(self, league_id, year=None):
         """
         Retrieves mappings between user IDs and display names.
         """
-        users_url = f'https://api.sleeper.app/v1/league/{league_id}/users'
-        users = self.fetch_data(users_url)
+        users = self.fetch_data(self.client.users, league_id, year)
         if users:
             return {user['user_id']: user.get('display_name', 'Unknown') for user in users}
         else:
             return {}
 
-    def get_roster_mappings(self, league_id):
+    def get_roster_mappings(self, league_id, year=None):
         """
         Retrieves mappings between roster IDs and owner IDs.
         """
-        rosters_url = f'https://api.sleeper.app/v1/league/{league_id}/rosters'
-        rosters = self.fetch_data(rosters_url)
+        rosters = self.fetch_data(self.client.rosters, league_id, year)
         if rosters:
             return {roster['roster_id']: roster.get('owner_id', 'Unknown') for roster in rosters}
         else:
             return {}
 
-    def fetch_data(self, url):
+    def fetch_data(self, fetch, *args):
         """
-        Fetches data from a given URL and returns the JSON response.
+        Calls a SleeperClient fetch method and returns the JSON response, or None if the request failed.
         """
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error fetching data from {url} (Status code: {response.status_code})")
+        try:
+            return fetch(*args)
+        except requests.exceptions.RequestException as e:
+            logger.error("Error fetching data: %s", e)
             return None
 
-    def is_week_processed(self, year, week):
+    def submit_league_fetches(self, executor, league_id, year):
         """
-        Checks if a particular week of a year has already been processed.
+        Queues a league's user and roster mappings and every week that needs processing on an executor.
+        Returns futures for the user mapping and roster mapping, and a dict mapping week number to a matchups future.
         """
-        return f"{year},{week}" in self.processed_weeks
+        user_mapping_future = executor.submit(self.get_user_mappings, league_id, year)
+        roster_mapping_future = executor.submit(self.get_roster_mappings, league_id, year)
+        week_futures = {
+            week: executor.submit(self.fetch_data, self.client.matchups, league_id, week, year)
+            for week in SEASON_WEEKS
+            if self.process_all_data or not self.is_week_processed(year, week)
+        }
+        return user_mapping_future, roster_mapping_future, week_futures
 
-    def process_league(self, league_id, year, largest_margins, smallest_margins):
+    def process_league(self, league_id, year, league_fetches):
         """
         Processes a league to calculate largest and smallest margins of victory.
+        league_fetches are the futures returned by submit_league_fetches; weeks are handled in order as they arrive.
+        Returns the largest margins, the smallest margins, and the weeks that produced them.
         """
-        user_mapping = self.get_user_mappings(league_id)
-        roster_mapping = self.get_roster_mappings(league_id)
+        largest_margins = []
+        smallest_margins = []
+        processed_weeks = []  # Recorded by run() once every league has finished
+        user_mapping_future, roster_mapping_future, week_futures = league_fetches
 
-        if not user_mapping or not roster_mapping:
-            print(f"Skipping league {league_id} for year {year} due to missing data.")
-            return
+        try:
+            logger.info("Processing League ID: %s for Year: %s", league_id, year)
+            user_mapping = user_mapping_future.result()
+            roster_mapping = roster_mapping_future.result()
 
-        stop_processing = False  # Flag to stop processing if both winner and loser points are zero
+            if not user_mapping or not roster_mapping:
+                logger.warning("Skipping league %s for year %s due to missing data.", league_id, year)
+                return largest_margins, smallest_margins, processed_weeks
 
-        for week in range(1, 19):  # Weeks 1 to 18
-            if stop_processing:
-                print(f"Stopping processing for year {year} as both teams scored zero in week {week - 1}.")
-                break
+            # Resolve each roster's owner name once per league rather than on every matchup
+            name_by_roster = {roster_id: user_mapping.get(owner_id, 'Unknown') for roster_id, owner_id in roster_mapping.items()}
 
-            if not self.process_all_data and self.is_week_processed(year, week):
-                print(f"Week {week} of Year {year} has already been processed. Skipping.")
-                continue
+            stop_processing = False  # Flag to stop processing if both winner and loser points are zero
 
-            print(f"Processing Week {week} for Year {year}...")
-            matchups_url = f'https://api.sleeper.app/v1/league/{league_id}/matchups/{week}'
-            matchups = self.fetch_data(matchups_url)
+            for week in SEASON_WEEKS:  # Weeks 1 to 18
+                if stop_processing:
+                    logger.info("Stopping processing for year %s as both teams scored zero in week %s.", year, week - 1)
+                    break
 
-            if not matchups:
-                continue
+                if not self.process_all_data and self.is_week_processed(year, week):
+                    logger.debug("Week %s of Year %s has already been processed. Skipping.", week, year)
+                    continue
 
-            # Organize matchups by matchup_id
-            matchup_dict = {}
-            for matchup in matchups:
-                matchup_id = matchup['matchup_id']
-                if matchup_id not in matchup_dict:
-                    matchup_dict[matchup_id] = []
-                matchup_dict[matchup_id].append(matchup)
+                logger.debug("Processing Week %s for Year %s...", week, year)
+                matchups = week_futures[week].result()
 
-            margins = []
-            for matchup_id, teams in matchup_dict.items():
-                if len(teams) != 2:
-                    # In case of bye weeks or incomplete data
+                if not matchups:
                     continue
 
-                team1, team2 = teams
-                points1 = team1.get('points', 0)
-                points2 = team2.get('points', 0)
-                roster_id1 = team1['roster_id']
-                roster_id2 = team2['roster_id']
-
-                owner_id1 = roster_mapping.get(roster_id1, 'Unknown')
-                owner_id2 = roster_mapping.get(roster_id2, 'Unknown')
-                owner_name1 = user_mapping.get(owner_id1, 'Unknown')
-                owner_name2 = user_mapping.get(owner_id2, 'Unknown')
-
-                margin = abs(points1 - points2)
-                if points1 >= points2:
-                    winner = owner_name1
-                    loser = owner_name2
-                    winner_points = points1
-                    loser_points = points2
-                else:
-                    winner = owner_name2
-                    loser = owner_name1
-                    winner_points = points2
-                    loser_points = points1
-
-                # Check if both winner and loser points are zero
-                if winner_points == 0 and loser_points == 0:
-                    print(f"Both teams scored zero points in Year {year}, Week {week}. Stopping further processing.")
-                    stop_processing = True
-                    break  # Break out of the matchup loop
-
-                margins.append({
-                    'Year': int(year),
-                    'Week': week,
-                    'Winner': winner,
-                    'Loser': loser,
-                    'Winner Points': winner_points,
-                    'Loser Points': loser_points,
-                    'Margin': margin
-                })
-
-            if stop_processing:
-                break  # Break out of the week loop
-
-            if margins:
-                # Find largest and smallest margins for this week
-                largest_margin = max(margins, key=lambda x: x['Margin'])
-                smallest_margin = min(margins, key=lambda x: x['Margin'])
-                largest_margins.append(largest_margin)
-                smallest_margins.append(smallest_margin)
-
-                # Mark the week as processed
-                self.save_processed_week(year, week)
+                # Organize matchups by matchup_id
+                matchup_dict = {}
+                for matchup in matchups:
+                    matchup_id = matchup['matchup_id']
+                    if matchup_id not in matchup_dict:
+                        matchup_dict[matchup_id] = []
+                    matchup_dict[matchup_id].append(matchup)
+
+                margins = []
+                for matchup_id, teams in matchup_dict.items():
+                    if len(teams) != 2:
+                        # In case of bye weeks or incomplete data
+                        continue
+
+                    team1, team2 = teams
+                    points1 = team1.get('points', 0)
+                    points2 = team2.get('points', 0)
+                    owner_name1 = name_by_roster.get(team1['roster_id'], 'Unknown')
+                    owner_name2 = name_by_roster.get(team2['roster_id'], 'Unknown')
+
+                    if points1 >= points2:
+                        winner, loser, winner_points, loser_points = owner_name1, owner_name2, points1, points2
+                    else:
+                        winner, loser, winner_points, loser_points = owner_name2, owner_name1, points2, points1
+                    margin = winner_points - loser_points
+
+                    # Check if both winner and loser points are zero
+                    if winner_points == 0 and loser_points == 0:
+                        logger.info("Both teams scored zero points in Year %s, Week %s. Stopping further processing.", year, week)
+                        stop_processing = True
+                        break  # Break out of the matchup loop
+
+                    margins.append({
+                        'Year': int(year),
+                        'Week': week,
+                        'Winner': winner,
+                        'Loser': loser,
+                        'Winner Points': winner_points,
+                        'Loser Points': loser_points,
+                        'Margin': margin
+                    })
+
+                if stop_processing:
+                    break  # Break out of the week loop
+
+                if margins:
+                    # Find largest and smallest margins for this week in a single pass
+                    largest_margin = smallest_margin = margins[0]
+                    for entry in margins[1:]:
+                        if entry['Margin'] > largest_margin['Margin']:
+                            largest_margin = entry
+                        elif entry['Margin'] < smallest_margin['Margin']:
+                            smallest_margin = entry
+                    largest_margins.append(largest_margin)
+                    smallest_margins.append(smallest_margin)
+
+                    # Mark the week as processed
+                    processed_weeks.append(week)
+        finally:
+            # Drop this league's queued fetches for weeks after an early stop, or after an error above
+            for future in week_futures.values():
+                future.cancel()
+        return largest_margins, smallest_margins, processed_weeks
 
     def ensure_headers(self, worksheet, headers):
         """
@@ -584,7 +931,7 @@ class MarginCalculator:
         """
         existing_headers = worksheet.row_values(1)
         if existing_headers != headers:
-            print(f"Headers are missing or incorrect in sheet '{worksheet.title}'. Updating headers.")
+            logger.info("Headers are missing or incorrect in sheet '%s'. Updating headers.", worksheet.title)
             worksheet.insert_row(headers, index=1)
 
     def upload_results(self, sheet_name, data):
@@ -617,46 +964,55 @@ class MarginCalculator:
             # Batch update to improve performance
             worksheet.append_rows(rows, value_input_option='USER_ENTERED')
         else:
-            # Read existing data to prevent duplication
-            existing_data = worksheet.get_all_records()
-            existing_rows = [
-                (int(row['Year']), int(row['Week'])) for row in existing_data
-            ]
-
+            # Only weeks missing from the processed weeks log were processed, so every entry is new
             new_rows = []
             for entry in data:
-                key = (entry['Year'], entry['Week'])
-                if key not in existing_rows:
-                    row = [
-                        entry['Year'],
-                        entry['Week'],
-                        entry['Winner'],
-                        entry['Loser'],
-                        entry['Winner Points'],
-                        entry['Loser Points'],
-                        entry['Margin']
-                    ]
-                    new_rows.append(row)
+                row = [
+                    entry['Year'],
+                    entry['Week'],
+                    entry['Winner'],
+                    entry['Loser'],
+                    entry['Winner Points'],
+                    entry['Loser Points'],
+                    entry['Margin']
+                ]
+                new_rows.append(row)
 
             if new_rows:
                 # Append new rows to the worksheet
                 worksheet.append_rows(new_rows, value_input_option='USER_ENTERED')
             else:
-                print(f"No new data to upload for sheet {sheet_name}.")
+                logger.info("No new data to upload for sheet %s.", sheet_name)
 
     def run(self):
         """
         Main execution method.
         """
-        print("Starting MarginCalculator execution...")
-        largest_margins = []
-        smallest_margins = []
+        logger.info("Starting MarginCalculator execution...")
+        leagues = []
         for year, league_id in self.league_ids.items():
             if league_id:
-                print(f"Processing League ID: {league_id} for Year: {year}")
-                self.process_league(league_id, year, largest_margins, smallest_margins)
+                leagues.append((year, league_id))
             else:
-                print(f"No League ID provided for Year: {year}")
+                logger.info("No League ID provided for Year: %s", year)
+
+        largest_margins = []
+        smallest_margins = []
+        # Every league's requests share one pool, so at most MAX_CONCURRENT_REQUESTS are in flight;
+        # leagues are then processed in config order as their fetches arrive
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        try:
+            league_fetches = {
+                year: self.submit_league_fetches(executor, league_id, year)
+                for year, league_id in leagues
+            }
+            for year, league_id in leagues:
+                league_largest, league_smallest, processed_weeks = self.process_league(league_id, year, league_fetches[year])
+                largest_margins.extend(league_largest)
+                smallest_margins.extend(league_smallest)
+                self.save_processed_weeks(year, processed_weeks)
+        finally:
+            executor.shutdown(cancel_futures=True)
 
         # After processing all leagues, upload the aggregated results
         if largest_margins:
@@ -667,26 +1023,29 @@ class MarginCalculator:
             smallest_margins.sort(key=lambda x: (x['Year'], x['Week']))
             self.upload_results("Smallest Margin", smallest_margins)
 
-        print("MarginCalculator execution completed.")
+        self._log_fh.flush()
+        logger.info("MarginCalculator execution completed.")
 
-class HighestScorerProcessor:
+class HighestScorerProcessor(ProcessedWeeksLog):
     """
     This class handles fetching data from the Sleeper API to find the highest scoring rostered player
     for each week, and uploading the results to Google Sheets.
     """
-    def __init__(self, config, processed_weeks_file='processed_weeks_highest_scorer.log'):
+    def __init__(self, config, processed_weeks_file='processed_weeks_highest_scorer.log', client=None):
         self.config = config
         self.spreadsheet_id = self.config['spreadsheet_id']
         self.service_account_file = self.config['service_account_file']
         self.league_ids = self.config['league_ids']
+        self.client = client or SleeperClient(self.config.get('cache_file', DEFAULT_CACHE_FILE))
         self.gc = self.authorize_google_sheets()
         self.spreadsheet = self.gc.open_by_key(self.spreadsheet_id)
         self.SHEET_NAME = 'Most Points Generated by Rostered Player All-Time'
-        self.processed_weeks_file = processed_weeks_file
         self.worksheet = self.open_or_create_sheet(self.SHEET_NAME)
         # Write headers if the sheet is new
         self.ensure_headers(self.worksheet, ['Year', 'Week', 'Display Name', 'Player Name', 'Points', 'Player ID'])
-        self.processed_weeks = self.read_processed_weeks()
+        self._player_mapping = None
+        self._player_mapping_lock = threading.Lock()
+        self.open_processed_weeks_log(processed_weeks_file)
 
     def authorize_google_sheets(self):
         """
@@ -714,84 +1073,52 @@ class HighestScorerProcessor:
         """
         existing_headers = worksheet.row_values(1)
         if existing_headers != headers:
-            print(f"Headers are missing or incorrect in sheet '{worksheet.title}'. Updating headers.")
+            logger.info("Headers are missing or incorrect in sheet '%s'. Updating headers.", worksheet.title)
             worksheet.insert_row(headers, index=1)
 
-    def read_processed_weeks(self):
+    @property
+    def player_mapping(self):
         """
-        Reads processed weeks from the log file.
+        Mapping from player_id to player details, fetched once and shared by every league and week.
+        The /players/nfl response is also kept in the on-disk cache, so later runs skip the download.
+        Years are processed concurrently, so the build is guarded by a lock and only done once.
         """
-        processed_weeks = set()
-        if os.path.exists(self.processed_weeks_file):
-            with open(self.processed_weeks_file, 'r') as file:
-                for line in file:
-                    line = line.strip()
-                    if line:
-                        processed_weeks.add(line)
-        return processed_weeks
+        with self._player_mapping_lock:
+            if self._player_mapping is None:
+                players = self.client.players()
+                self._player_mapping = {player_id: {
+                    'first_name': player.get('first_name', 'Unknown'),
+                    'last_name': player.get('last_name', 'Unknown'),
+                    'full_name': f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
+                } for player_id, player in players.items()}
+        return self._player_mapping
 
-    def save_processed_week(self, year, week):
+    def build_league_mappings(self, users, rosters):
         """
-        Appends the processed week to the log file.
+        Builds the user and roster mappings from a league's users and rosters.
         """
-        with open(self.processed_weeks_file, 'a') as file:
-            file.write(f"{year},{week}\n")
-        self.processed_weeks.add(f"{year},{week}")
+        # Create a mapping from user_id to user details
+        user_mapping = {user['user_id']: {
+            'display_name': user.get('display_name', 'Unknown'),
+            'username': user.get('username', 'Unknown')
+        } for user in users}
 
-    def is_week_processed(self, year, week):
-        """
-        Checks if a particular week of a year has already been processed.
-        """
-        return f"{year},{week}" in self.processed_weeks
+        # Create a mapping from roster_id to owner_id (user_id)
+        roster_mapping = {roster['roster_id']: roster.get('owner_id', 'Unknown') for roster in rosters}
+
+        return user_mapping, roster_mapping
 
-    def process_week(self, league_id, year, week):
+    def process_week(self, league_id, year, week, user_mapping, roster_mapping, player_mapping):
         """
         Processes data for a given week to find the highest scoring rostered player.
+        Users, rosters, and players are week-invariant, so the caller fetches them once and passes the mappings in.
         """
-        # Define the API endpoints for the current week
-        matchups_url = f'https://api.sleeper.app/v1/league/{league_id}/matchups/{week}'
-        rosters_url = f'https://api.sleeper.app/v1/league/{league_id}/rosters'
-        users_url = f'https://api.sleeper.app/v1/league/{league_id}/users'
-
         # Initialize the response variable
         highest_scorer = None
 
         try:
             # Make the GET request for matchups
-            matchups_response = requests.get(matchups_url)
-            matchups_response.raise_for_status()
-            matchups = matchups_response.json()
-
-            # Make the GET request for rosters
-            rosters_response = requests.get(rosters_url)
-            rosters_response.raise_for_status()
-            rosters = rosters_response.json()
-
-            # Make the GET request for users to get display names and user info
-            users_response = requests.get(users_url)
-            users_response.raise_for_status()
-            users = users_response.json()
-
-            # Create a mapping from user_id to user details
-            user_mapping = {user['user_id']: {
-                'display_name': user.get('display_name', 'Unknown'),
-                'username': user.get('username', 'Unknown')
-            } for user in users}
-
-            # Create a mapping from roster_id to owner_id (user_id)
-            roster_mapping = {roster['roster_id']: roster['owner_id'] for roster in rosters}
-
-            # Fetch the player information from the Sleeper API
-            players_response = requests.get('https://api.sleeper.app/v1/players/nfl')
-            players_response.raise_for_status()
-            players = players_response.json()
-
-            # Create a mapping from player_id to player details (full name)
-            player_mapping = {player_id: {
-                'first_name': player.get('first_name', 'Unknown'),
-                'last_name': player.get('last_name', 'Unknown'),
-                'full_name': f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
-            } for player_id, player in players.items()}
+            matchups = self.client.matchups(league_id, week, year)
 
             # Variables to keep track of the highest scorer
             highest_points = float('-inf')
@@ -809,84 +1136,150 @@ class HighestScorerProcessor:
                 user_details = user_mapping.get(user_id, {})
                 display_name = user_details.get('display_name', 'Unknown')
 
-                # Create a list of dictionaries containing player IDs and their corresponding points
-                starters_with_points = [
-                    {'player_id': player_id, 'points': players_points.get(player_id, 0)}
-                    for player_id in starters
-                ]
+                if not starters:
+                    continue
 
-                # Check if any starter has the highest points
-                for starter in starters_with_points:
-                    if starter['points'] > highest_points:
-                        highest_points = starter['points']
-                        highest_scorer = {
-                            'player_id': starter['player_id'],
-                            'points': starter['points'],
-                            'user_id': user_id,
-                            'display_name': display_name,
-                            'player_name': player_mapping.get(starter['player_id'], {}).get('full_name', 'Unknown Player')
-                        }
+                # Find this roster's top starter, then check it against the highest so far
+                top_player_id = max(starters, key=lambda player_id: players_points.get(player_id, 0))
+                top_points = players_points.get(top_player_id, 0)
+                if top_points > highest_points:
+                    highest_points = top_points
+                    highest_scorer = {
+                        'player_id': top_player_id,
+                        'points': top_points,
+                        'user_id': user_id,
+                        'display_name': display_name,
+                        'player_name': player_mapping.get(top_player_id, {}).get('full_name', 'Unknown Player')
+                    }
         except requests.exceptions.RequestException as e:
-            print(f"An error occurred while fetching data: {e}")
+            logger.error("An error occurred while fetching data: %s", e)
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
 
         # Return the highest_scorer even if points are zero or negative
         return highest_scorer
 
-    def process_year(self, year, league_id):
+    def submit_year_fetches(self, executor, year, league_id):
         """
-        Processes data for all weeks in a given year and league.
+        Fetches the week-invariant league data for a year, then queues every unprocessed week on an executor.
+        Returns a dict mapping week number to a future for that week's highest scorer; empty if there is nothing to do.
         """
-        weeks_to_process = range(1, 19)  # Process weeks 1 through 18
+        pending_weeks = [week for week in SEASON_WEEKS if not self.is_week_processed(year, week)]
+        if not pending_weeks:
+            logger.info("Completed processing all weeks for Year %s.", year)
+            return {}
+
+        # Fetch the week-invariant league data once instead of on every week, with all three requests in flight together
+        try:
+            users_future = executor.submit(self.client.users, league_id, year)
+            rosters_future = executor.submit(self.client.rosters, league_id, year)
+            players_future = executor.submit(lambda: self.player_mapping)
+            user_mapping, roster_mapping = self.build_league_mappings(users_future.result(), rosters_future.result())
+            player_mapping = players_future.result()
+        except requests.exceptions.RequestException as e:
+            logger.error("An error occurred while fetching league data for Year %s: %s", year, e)
+            return {}
+        except (TypeError, KeyError, AttributeError) as e:
+            # Sleeper answers unknown league IDs with a null body, which cannot be mapped
+            logger.error("Unexpected league data for Year %s, skipping the year: %s", year, e)
+            return {}
+
+        return {
+            week: executor.submit(self.process_week, league_id, year, week, user_mapping, roster_mapping, player_mapping)
+            for week in pending_weeks
+        }
+
+    def process_year(self, year, week_futures):
+        """
+        Processes data for all weeks in a given year, in week order, from the futures returned by submit_year_fetches.
+        Returns the new sheet rows and the weeks to mark as processed; run() writes both.
+        """
+        weeks_to_process = SEASON_WEEKS  # Process weeks 1 through 18
+        new_rows = []  # Records for this year, appended to the sheet in one write
+        processed_weeks = []  # Weeks to mark as processed once their records are written
 
-        for week in weeks_to_process:
-            if not self.is_week_processed(year, week):
-                print(f"Processing Year {year}, Week {week}...")
-                highest_scorer = self.process_week(league_id, year, week)
-                if highest_scorer:
-                    if highest_scorer['points'] == 0:
-                        print(f"Highest scorer has 0 points in Year {year}, Week {week}. Stopping further processing.")
-                        # Do not mark the week as processed
-                        break  # Stop processing further weeks for this year
+        if not week_futures:
+            return new_rows, processed_weeks
+
+        try:
+            for week in weeks_to_process:
+                if not self.is_week_processed(year, week):
+                    logger.debug("Processing Year %s, Week %s...", year, week)
+                    highest_scorer = week_futures[week].result()
+                    if highest_scorer:
+                        if highest_scorer['points'] == 0:
+                            logger.info("Highest scorer has 0 points in Year %s, Week %s. Stopping further processing.", year, week)
+                            # Do not mark the week as processed
+                            break  # Stop processing further weeks for this year
+                        else:
+                            # Queue new record
+                            new_rows.append([
+                                int(year),
+                                int(week),
+                                highest_scorer['display_name'],
+                                highest_scorer['player_name'],
+                                float(highest_scorer['points']),
+                                highest_scorer['player_id']
+                            ])
+                            processed_weeks.append(week)
                     else:
-                        # Append new record
-                        self.worksheet.append_row([
-                            int(year),
-                            int(week),
-                            highest_scorer['display_name'],
-                            highest_scorer['player_name'],
-                            float(highest_scorer['points']),
-                            highest_scorer['player_id']
-                        ])
-                        self.save_processed_week(year, week)
+                        logger.warning("No valid highest scorer for Year %s - Week %s. Skipping to next week.", year, week)
+                        processed_weeks.append(week)  # Mark as processed even if no data
+                        continue
                 else:
-                    print(f"No valid highest scorer for Year {year} - Week {week}. Skipping to next week.")
-                    self.save_processed_week(year, week)  # Mark as processed even if no data
-                    continue
+                    logger.debug("Year %s - Week %s has already been processed.", year, week)
             else:
-                print(f"Year {year} - Week {week} has already been processed.")
-        else:
-            print(f"Completed processing all weeks for Year {year}.")
+                logger.info("Completed processing all weeks for Year %s.", year)
+        finally:
+            # Drop this year's queued weeks after an early stop, or after an error
+            for future in week_futures.values():
+                future.cancel()
+
+        return new_rows, processed_weeks
 
     def run(self):
-        print("Starting HighestScorerProcessor execution...")
+        logger.info("Starting HighestScorerProcessor execution...")
+        leagues = []
         for year, league_id in self.league_ids.items():
             if league_id:
-                self.process_year(year, league_id)
+                leagues.append((year, league_id))
             else:
-                print(f"No League ID provided for Year: {year}")
-        print("HighestScorerProcessor execution completed.")
+                logger.info("No League ID provided for Year: %s", year)
+
+        # Every year's requests share one pool, so at most MAX_CONCURRENT_REQUESTS are in flight;
+        # years are then processed and written in config order as their weeks arrive
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        try:
+            year_futures = {
+                year: self.submit_year_fetches(executor, year, league_id)
+                for year, league_id in leagues
+            }
+            for year, week_futures in year_futures.items():
+                new_rows, processed_weeks = self.process_year(year, week_futures)
+                # Batch update to improve performance
+                if new_rows:
+                    self.worksheet.append_rows(new_rows, value_input_option='RAW')
+                self.save_processed_weeks(year, processed_weeks)
+        finally:
+            executor.shutdown(cancel_futures=True)
+        self._log_fh.flush()
+        logger.info("HighestScorerProcessor execution completed.")
 
 if __name__ == '__main__':
+    # Per-request and per-week detail is logged at DEBUG; set "log_level" in config.json to see it
+    logging.basicConfig(level=config.get('log_level', 'INFO').upper(), format='%(asctime)s %(levelname)s %(message)s')
+
+    # One Sleeper API client shared by every processor, so league data is only fetched once
+    sleeper_client = SleeperClient(config.get('cache_file', DEFAULT_CACHE_FILE))
+
     # Instantiate and run SleeperSheets
-    sleeper_sheets = SleeperSheets(config)
+    sleeper_sheets = SleeperSheets(config, client=sleeper_client)
     sleeper_sheets.run()
 
     # Instantiate and run MarginCalculator
-    margin_calculator = MarginCalculator(config)
-    margin_calculator.run()
+    with MarginCalculator(config, client=sleeper_client) as margin_calculator:
+        margin_calculator.run()
 
     # Instantiate and run HighestScorerProcessor
-    highest_scorer_processor = HighestScorerProcessor(config)
-    highest_scorer_processor.run()
+    with HighestScorerProcessor(config, client=sleeper_client) as highest_scorer_processor:
+        highest_scorer_processor.run()